@@ -5,22 +5,44 @@ Checks SaaS product release notes pages for updates and generates RSS feeds per
 Designed to run via GitHub Actions on a cron schedule.
 """
 
+import asyncio
 import json
 import hashlib
+import heapq
 import os
 import sys
-import time
 import re
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from xml.etree.ElementTree import Element, SubElement, tostring, ElementTree
-from xml.dom import minidom
+from urllib.parse import urljoin, urlparse
 import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 
-import requests
+import aiohttp
 import cloudscraper
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import feedparser
+import soupsieve
+try:
+    from lxml.etree import Element, SubElement, tostring
+    LXML_ETREE = True
+except ImportError:
+    # Fall back to the stdlib ElementTree, which indents in place before serializing
+    from xml.etree.ElementTree import Element, SubElement, indent, register_namespace, tostring
+    LXML_ETREE = False
+try:
+    import lxml.html  # noqa: F401
+    HTML_PARSER = "lxml"  # C-based, several times faster than html.parser
+except ImportError:
+    HTML_PARSER = "html.parser"
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
 from slack_notify import send_slack_notifications
 from zoom_notify import send_zoom_notifications
 from gchat_notify import send_gchat_notifications
@@ -29,29 +51,153 @@ from gchat_notify import send_gchat_notifications
 BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_FILE = BASE_DIR / "config" / "teams.json"
 SEEN_FILE = BASE_DIR / "data" / "seen.json"
+HTTP_CACHE_FILE = BASE_DIR / "data" / "http_cache.json"
 FEEDS_DIR = BASE_DIR / "docs" / "feeds"
 MAX_FEED_ITEMS = 100  # Max items to keep in each team's RSS feed
 RECENT_PER_PRODUCT = 5  # Always keep latest N items per product in feed
+MAX_SEEN_IDS = 200  # Seen item IDs remembered per product
 REQUEST_TIMEOUT = 30
+MAX_CONNECTIONS = 32  # Total concurrent HTTP connections across all hosts
+MAX_PER_HOST = 2  # Concurrent requests allowed against any single host (be polite)
+MIN_HOST_INTERVAL = 1.0  # Seconds between starting requests to the same host
+MAX_RETRIES = 2  # Extra attempts after a throttled (429) or server error (5xx) response
+RETRY_BACKOFF = 0.5  # Seconds before the first retry, doubling for each one after
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+PARSER_VERSION = 1  # Bump when a _parse_* change should invalidate cached items
+ATOM_NS = "http://www.w3.org/2005/Atom"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 
+# Precompiled patterns used on every scraped item
+_WS_RE = re.compile(r'\s+')
+_CTRL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+# Something that looks like an HTML tag, comment or doctype, as opposed to a bare "<"
+_TAG_RE = re.compile(r'<\s*[a-zA-Z/!][^>]*>')
+# Non-content elements stripped from pages before extracting text
+_JUNK_TAGS = frozenset({"script", "style", "nav", "footer", "header", "noscript", "svg", "iframe"})
+# Elements whose contents feedparser's sanitizer dropped from RSS summaries
+_UNSAFE_SUMMARY_TAGS = frozenset({"script", "style", "applet"})
+
+# Common changelog patterns tried, in priority order, when the configured selector misses
+FALLBACK_SELECTORS = [
+    "article", ".changelog-entry", ".release-note", ".post",
+    "section:not(:empty)", ".entry", ".update",
+    "[class*='release']", "[class*='changelog']", "[class*='update']",
+]
+_FALLBACK_CSS = soupsieve.compile(", ".join(FALLBACK_SELECTORS))
+_FALLBACK_PATTERNS = tuple((selector, soupsieve.compile(selector)) for selector in FALLBACK_SELECTORS)
+
+# Fixed selectors looked up on every scraped page or element
+_HEADINGS_CSS = soupsieve.compile("h2, h3")
+_TIME_CSS = soupsieve.compile("time[datetime]")
+_LINK_CSS = soupsieve.compile("a[href]")
+
+# Titles containing any of these are navigation or boilerplate, not releases
+_SKIP_WORDS = frozenset({
+    "menu", "navigation", "sidebar", "footer", "header", "cookie",
+    "privacy", "sign in", "log in", "subscribe", "contact", "about us",
+})
+_INTERCOM_SKIP_WORDS = _SKIP_WORDS | {"our blog post", "learn more", "read more", "see more", "click here"}
+# Each set as one case-insensitive alternation, so a title is scanned once without lowercasing it
+_SKIP_WORDS_RE = re.compile("|".join(map(re.escape, sorted(_SKIP_WORDS))), re.IGNORECASE)
+_INTERCOM_SKIP_WORDS_RE = re.compile("|".join(map(re.escape, sorted(_INTERCOM_SKIP_WORDS))), re.IGNORECASE)
+
+_VERSION_LINK_RE = re.compile(r'(v?\d+\.\d+|release|update|version|changelog|what.?s.new)', re.I)
+
+# Intercom article headings: dates (e.g., "March 2, 2026") and months (e.g., "March 2026")
+_DATE_HEADING_RE = re.compile(
+    r'(?:January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+\d{1,2},?\s+\d{4}',
+    re.IGNORECASE
+)
+_MONTH_HEADING_RE = re.compile(
+    r'^(?:January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+\d{4}$',
+    re.IGNORECASE
+)
+
+# Zendesk section anchors like "released_2026"
+_RELEASED_ANCHOR_RE = re.compile(r"^released_\d{4}$")
+# Configured anchors that opt in to the latest-year fallback; a prefix match, unlike the above
+_RELEASED_ANCHOR_PREFIX_RE = re.compile(r"released_\d{4}")
+
+
+# Output of the product being checked in the current task, printed under its
+# header once all products are done; None outside check_all_products
+_product_log: ContextVar[list[str] | None] = ContextVar("_product_log", default=None)
+
+
+def log(message: str):
+    """Print a message, or hold it for the product being checked concurrently."""
+    buffer = _product_log.get()
+    if buffer is None:
+        print(message)
+    else:
+        buffer.append(message)
+
 
 def load_json(path: Path) -> dict:
     """Load a JSON file, returning empty dict if not found."""
     if path.exists():
+        if orjson:
+            return orjson.loads(path.read_bytes())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     return {}
 
 
-def save_json(path: Path, data: dict):
-    """Save data to a JSON file."""
+def _json_format(compact: bool) -> dict:
+    """Return json module options for indented or compact output."""
+    return {"separators": (",", ":")} if compact else {"indent": 2}
+
+
+def dump_json(data, compact: bool = False) -> bytes:
+    """Serialize data as UTF-8 JSON, indented unless compact is set."""
+    if orjson:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, **_json_format(compact)).encode("utf-8")
+
+
+def _temp_path(path: Path) -> Path:
+    """Return the sibling temp file a write goes to before replacing path."""
+    return path.with_suffix(path.suffix + ".tmp")
+
+
+def write_file(path: Path, data: bytes):
+    """Write a file atomically, so an interrupted run never leaves it truncated."""
+    tmp = _temp_path(path)
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_files(writes: list[tuple[Path, bytes]]):
+    """Write independent files concurrently so their I/O can overlap."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(write_file, path, data) for path, data in writes]
+        for future in futures:
+            future.result()
+
+
+def save_json(path: Path, data: dict, compact: bool = False):
+    """Save data to a JSON file atomically.
+
+    Use compact for internal caches nobody reads by hand; it skips the
+    indentation and the whitespace after separators.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson:
+        write_file(path, dump_json(data, compact))
+        return
+
+    # Stream the encoded chunks rather than building one large string
+    tmp = _temp_path(path)
+    with open(tmp, "w", encoding="utf-8") as f:
+        for chunk in json.JSONEncoder(ensure_ascii=False, **_json_format(compact)).iterencode(data):
+            f.write(chunk)
+    os.replace(tmp, path)
 
 
-def check_zendesk_api_source(product: dict) -> list[dict]:
+async def check_zendesk_api_source(session: aiohttp.ClientSession, product: dict) -> list[dict]:
     """Check a Zendesk Help Center section for articles via API with basic auth."""
     source = product["source"]
     section_id = source.get("section_id", "")
@@ -62,20 +208,18 @@ def check_zendesk_api_source(product: dict) -> list[dict]:
     password = os.environ.get(env_password, "")
 
     api_url = f"https://{domain}/api/v2/help_center/en-us/sections/{section_id}/articles.json?sort_by=updated_at&sort_order=desc&per_page=10"
-    print(f"  Zendesk API: {api_url}")
+    log(f"  Zendesk API: {api_url}")
 
+    auth = aiohttp.BasicAuth(email, password) if email and password else None
+    return await fetch_and_parse(session, api_url, product, _parse_zendesk_articles, auth=auth)
+
+
+def _parse_zendesk_articles(content: bytes, product: dict) -> list[dict]:
+    """Extract articles from a Zendesk Help Center API response."""
     try:
-        auth = (email, password) if email and password else None
-        resp = requests.get(
-            api_url,
-            auth=auth,
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception as e:
-        print(f"  [WARN] Zendesk API error: {e}")
+        data = json.loads(content)
+    except ValueError as e:
+        log(f"  [WARN] Zendesk API error: {e}")
         return []
 
     articles = data.get("articles", [])
@@ -86,7 +230,7 @@ def check_zendesk_api_source(product: dict) -> list[dict]:
         updated = article.get("updated_at", "")
         items.append({"title": title, "link": url, "date": updated})
 
-    print(f"  Found {len(items)} articles from API")
+    log(f"  Found {len(items)} articles from API")
     return items
 
 
@@ -102,7 +246,7 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
     password = os.environ.get(env_password, "") if env_password else ""
 
     if not article_id or not domain:
-        print(f"  [ERROR] Missing article_id or domain for zendesk_article source")
+        log(f"  [ERROR] Missing article_id or domain for zendesk_article source")
         return []
 
     article_url = f"https://{domain}/hc/en-us/articles/{article_id}"
@@ -131,34 +275,34 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
 
     # Strategy 1: Try direct HTML scrape (works if article is public)
     try:
-        print(f"  Fetching article page: {article_url}")
+        log(f"  Fetching article page: {article_url}")
         direct_resp = scraper.get(article_url, timeout=REQUEST_TIMEOUT)
         direct_resp.raise_for_status()
-        print(f"  Direct scrape response: {direct_resp.status_code}, length={len(direct_resp.content)}")
+        log(f"  Direct scrape response: {direct_resp.status_code}, length={len(direct_resp.content)}")
         page_soup = BeautifulSoup(direct_resp.content, "html.parser")
         title_tag = page_soup.title
-        print(f"  Page title: {title_tag.string.strip() if title_tag and title_tag.string else 'NO TITLE'}")
+        log(f"  Page title: {title_tag.string.strip() if title_tag and title_tag.string else 'NO TITLE'}")
         body_el = page_soup.select_one(".article-body, [itemprop='articleBody'], article")
         if body_el:
             body_html = str(body_el)
             updated_at = datetime.now(timezone.utc).isoformat()
-            print(f"  Got article content via direct HTML scrape ({len(body_html)} chars)")
+            log(f"  Got article content via direct HTML scrape ({len(body_html)} chars)")
         else:
             # Debug: show what selectors are available
             all_classes = set()
             for el in page_soup.find_all(True):
                 for c in el.get("class", []):
                     all_classes.add(c)
-            print(f"  [WARN] No article body found. Classes on page: {sorted(all_classes)[:30]}")
+            log(f"  [WARN] No article body found. Classes on page: {sorted(all_classes)[:30]}")
     except Exception as e:
-        print(f"  [WARN] Direct HTML scrape failed: {e}")
+        log(f"  [WARN] Direct HTML scrape failed: {e}")
 
     # Strategy 2: If direct scrape failed, try session auth + API
     if not body_html and email and password:
         session = scraper  # Reuse cloudscraper session to bypass Cloudflare
         try:
             signin_url = f"https://{domain}/hc/en-us/signin"
-            print(f"  Signing in to {domain}...")
+            log(f"  Signing in to {domain}...")
             signin_resp = session.get(signin_url, timeout=REQUEST_TIMEOUT)
             signin_soup = BeautifulSoup(signin_resp.content, "html.parser")
             csrf_input = signin_soup.find("input", {"name": "authenticity_token"})
@@ -173,12 +317,12 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
             if csrf_token:
                 login_data["authenticity_token"] = csrf_token
             login_resp = session.post(form_action, data=login_data, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-            print(f"  Login response: {login_resp.status_code}")
+            log(f"  Login response: {login_resp.status_code}")
         except Exception as e:
-            print(f"  [WARN] Session login failed: {e}")
+            log(f"  [WARN] Session login failed: {e}")
 
         # Try API with session cookies
-        print(f"  Zendesk Article API (session): {api_url}")
+        log(f"  Zendesk Article API (session): {api_url}")
         try:
             resp = session.get(api_url, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
@@ -187,13 +331,13 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
             body_html = article.get("body", "")
             article_url = article.get("html_url", "") or article_url
             updated_at = article.get("updated_at", "")
-            print(f"  Got article content via API")
+            log(f"  Got article content via API")
         except Exception as e:
-            print(f"  [WARN] API with session failed: {e}")
+            log(f"  [WARN] API with session failed: {e}")
 
     # Strategy 3: If still no content, try API without auth (some are public)
     if not body_html:
-        print(f"  Trying API without auth: {api_url}")
+        log(f"  Trying API without auth: {api_url}")
         try:
             resp = scraper.get(api_url, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
@@ -202,12 +346,12 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
             body_html = article.get("body", "")
             article_url = article.get("html_url", "") or article_url
             updated_at = article.get("updated_at", "")
-            print(f"  Got article content via unauthenticated API")
+            log(f"  Got article content via unauthenticated API")
         except Exception as e:
-            print(f"  [WARN] Unauthenticated API also failed: {e}")
+            log(f"  [WARN] Unauthenticated API also failed: {e}")
 
     if not body_html:
-        print(f"  [ERROR] All strategies failed for article {article_id}")
+        log(f"  [ERROR] All strategies failed for article {article_id}")
         return []
 
     soup = BeautifulSoup(body_html, "html.parser")
@@ -217,7 +361,7 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
     # Log all h2 headings and their IDs for debugging
     all_h2s = soup.find_all("h2")
     if all_h2s:
-        print(f"  [DEBUG] Article h2 headings found:")
+        log(f"  [DEBUG] Article h2 headings found:")
         for h2 in all_h2s:
             h2_id = h2.get("id", "")
             h2_text = h2.get_text(strip=True)[:80]
@@ -226,25 +370,24 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
             anchor_name = anchor_child.get("name", "") if anchor_child else ""
             id_info = f" id='{h2_id}'" if h2_id else ""
             anchor_info = f" anchor='{anchor_name}'" if anchor_name else ""
-            print(f"    - {h2_text}{id_info}{anchor_info}")
+            log(f"    - {h2_text}{id_info}{anchor_info}")
 
     if section_anchor:
         anchor_el = soup.find(id=section_anchor)
         if not anchor_el:
             anchor_el = soup.find("a", {"name": section_anchor})
         if not anchor_el:
-            print(f"  [WARN] Section anchor '{section_anchor}' not found in article {article_id}")
+            log(f"  [WARN] Section anchor '{section_anchor}' not found in article {article_id}")
             # Dynamic fallback: if anchor looks like "released_YYYY", find the
             # latest "released_*" section in the document so the monitor keeps
             # working across year boundaries without config changes.
-            import re as _re
 
             # Strategy 1: look for released_YYYY pattern with any year
-            if _re.match(r"released_\d{4}", section_anchor):
+            if _RELEASED_ANCHOR_PREFIX_RE.match(section_anchor):
                 candidates = []
-                for el in soup.find_all(id=_re.compile(r"^released_\d{4}$")):
+                for el in soup.find_all(id=_RELEASED_ANCHOR_RE):
                     candidates.append(el)
-                for el in soup.find_all("a", {"name": _re.compile(r"^released_\d{4}$")}):
+                for el in soup.find_all("a", {"name": _RELEASED_ANCHOR_RE}):
                     candidates.append(el)
                 if candidates:
                     candidates.sort(
@@ -253,22 +396,23 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
                     )
                     anchor_el = candidates[0]
                     found_anchor = anchor_el.get("id") or anchor_el.get("name", "")
-                    print(f"  [INFO] Using fallback anchor '{found_anchor}' instead")
+                    log(f"  [INFO] Using fallback anchor '{found_anchor}' instead")
 
             # Strategy 2: look for any element whose id or anchor name
             # contains "released" (case-insensitive)
             if not anchor_el:
                 base_word = section_anchor.split("_")[0].lower()  # e.g. "released"
-                for el in soup.find_all(id=_re.compile(base_word, _re.IGNORECASE)):
+                base_re = re.compile(base_word, re.IGNORECASE)
+                for el in soup.find_all(id=base_re):
                     anchor_el = el
                     found_anchor = el.get("id", "")
-                    print(f"  [INFO] Using fuzzy fallback anchor '{found_anchor}' instead")
+                    log(f"  [INFO] Using fuzzy fallback anchor '{found_anchor}' instead")
                     break
                 if not anchor_el:
-                    for el in soup.find_all("a", {"name": _re.compile(base_word, _re.IGNORECASE)}):
+                    for el in soup.find_all("a", {"name": base_re}):
                         anchor_el = el
                         found_anchor = el.get("name", "")
-                        print(f"  [INFO] Using fuzzy fallback anchor '{found_anchor}' instead")
+                        log(f"  [INFO] Using fuzzy fallback anchor '{found_anchor}' instead")
                         break
 
             if not anchor_el:
@@ -311,27 +455,222 @@ def check_zendesk_article_source(product: dict) -> list[dict]:
     return items
 
 
-def make_request(url: str) -> requests.Response | None:
-    """Make an HTTP GET request with error handling."""
-    headers = {"User-Agent": USER_AGENT}
+# Returned by fetch() when a page hasn't changed since the previous run
+NOT_MODIFIED = object()
+
+# URL -> {"etag", "last_modified", "content_hash", "items"} from previous runs,
+# where "items" maps a product fingerprint to the items parsed from the body
+_http_cache: dict[str, dict] = {}
+
+# URL -> product fingerprints that read it this run; anything else is pruned on save
+_http_cache_used: dict[str, set[str]] = {}
+
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+# Host -> time.monotonic() at which its next request may start
+_host_next_request: dict[str, float] = {}
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent requests to the URL's host."""
+    host = urlparse(url).netloc
+    if host not in _host_semaphores:
+        _host_semaphores[host] = asyncio.Semaphore(MAX_PER_HOST)
+    return _host_semaphores[host]
+
+
+async def _wait_for_host(url: str):
+    """Space out requests to the URL's host by MIN_HOST_INTERVAL.
+
+    Each caller reserves the next slot before sleeping, so concurrent requests
+    to one host queue up behind each other while other hosts aren't delayed.
+    """
+    host = urlparse(url).netloc
+    now = time.monotonic()
+    start = max(now, _host_next_request.get(host, now))
+    _host_next_request[host] = start + MIN_HOST_INTERVAL
+    if start > now:
+        await asyncio.sleep(start - now)
+
+
+def _retry_delay(resp: aiohttp.ClientResponse, attempt: int) -> float:
+    """Return how long to wait before retrying, honoring a Retry-After in seconds."""
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), REQUEST_TIMEOUT)
+    return RETRY_BACKOFF * 2 ** attempt
+
+
+async def fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    auth: aiohttp.BasicAuth | None = None,
+    conditional: bool = True,
+) -> bytes | object | None:
+    """Make a conditional HTTP GET request with error handling.
+
+    Returns the response body, NOT_MODIFIED if the server answers 304 or the
+    body is identical to the previous run's, or None if the request failed.
+    With conditional=False no validators are sent and the body is always
+    returned, though the cache entry is still updated for the next run.
+    """
+    cached = _http_cache.get(url)
+    headers = {}
+    if conditional and cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    async with _host_semaphore(url):
+        for attempt in range(MAX_RETRIES + 1):
+            await _wait_for_host(url)
+            try:
+                async with session.get(url, auth=auth, headers=headers, allow_redirects=True) as resp:
+                    if resp.status == 304:
+                        log(f"  Not modified since last run: {url}")
+                        return NOT_MODIFIED
+                    if resp.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        delay = _retry_delay(resp, attempt)
+                    else:
+                        resp.raise_for_status()
+                        content = await resp.read()
+                        break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log(f"  [WARN] Failed to fetch {url}: {e}")
+                return None
+
+            # Back off outside the response so its connection goes back to the pool
+            log(f"  [WARN] HTTP {resp.status} from {url}, retrying in {delay:g}s")
+            await asyncio.sleep(delay)
+
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    validators = {
+        "etag": resp.headers.get("ETag", ""),
+        "last_modified": resp.headers.get("Last-Modified", ""),
+    }
+    # Read the entry again: another product sharing the URL may have replaced it
+    stored = _http_cache.get(url)
+    if stored is not None and stored.get("content_hash") == content_hash:
+        # Same body, so the items already cached for it are still valid
+        stored.update(validators)
+        if conditional and stored is cached:
+            log(f"  Content unchanged since last run: {url}")
+            return NOT_MODIFIED
+        return content
+    _http_cache[url] = {**validators, "content_hash": content_hash}
+    return content
+
+
+def _product_fingerprint(product: dict) -> str:
+    """Hash the config the parsers read, so cached items are dropped when it changes."""
+    raw = json.dumps(
+        [PARSER_VERSION, product["source"], product.get("release_notes_url", "")],
+        sort_keys=True,
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def load_http_cache():
+    """Load the previous run's HTTP cache, starting empty if it can't be read.
+
+    The cache only saves work, so a corrupt or conflicted file mustn't stop a run.
+    """
+    _http_cache.clear()
+    _http_cache_used.clear()
     try:
-        resp = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        resp.raise_for_status()
-        return resp
-    except requests.RequestException as e:
-        print(f"  [WARN] Failed to fetch {url}: {e}")
-        return None
+        cache = load_json(HTTP_CACHE_FILE)
+    except (ValueError, OSError) as e:
+        print(f"[WARN] Ignoring unreadable HTTP cache {HTTP_CACHE_FILE}: {e}")
+        return
+    if not isinstance(cache, dict):
+        print(f"[WARN] Ignoring malformed HTTP cache {HTTP_CACHE_FILE}")
+        return
+    _http_cache.update(cache)
+
+
+def prune_http_cache():
+    """Drop cached URLs and product fingerprints that no product used this run."""
+    for url in list(_http_cache):
+        keys = _http_cache_used.get(url)
+        if keys is None:
+            del _http_cache[url]
+            continue
+        items = _http_cache[url].get("items", {})
+        for key in [key for key in items if key not in keys]:
+            del items[key]
+
+
+async def fetch_and_parse(
+    session: aiohttp.ClientSession,
+    url: str,
+    product: dict,
+    parse: Callable[[bytes, dict], list[dict]],
+    auth: aiohttp.BasicAuth | None = None,
+) -> list[dict]:
+    """Fetch a URL and parse its body with parse(content, product).
+
+    The parsed items are cached with the URL's validators, so a page that
+    hasn't changed since the previous run is neither downloaded nor parsed
+    again. Without cached items for this product the request is made
+    unconditionally, and its items are added alongside those of any other
+    product reading the same URL.
+    """
+    key = _product_fingerprint(product)
+    _http_cache_used.setdefault(url, set()).add(key)
+    cached_items = _http_cache.get(url, {}).get("items", {})
+    content = await fetch(session, url, auth=auth, conditional=key in cached_items)
+    if content is None:
+        return []
+    if content is NOT_MODIFIED:
+        return cached_items[key]
+
+    # Parsing is CPU-bound, so keep it off the event loop
+    items = await asyncio.to_thread(parse, content, product)
+    _http_cache[url].setdefault("items", {})[key] = items
+    return items
 
 
 def generate_item_id(product_id: str, title: str, link: str = "") -> str:
     """Generate a unique, stable ID for a release item."""
     raw = f"{product_id}:{title}:{link}".strip().lower()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def legacy_item_id(product_id: str, title: str, link: str = "") -> str:
+    """Generate an item ID the way it was done before the switch to BLAKE2b."""
+    raw = f"{product_id}:{title}:{link}".strip().lower()
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
 
 
+def resolve_item_id(product_id: str, title: str, link: str, seen_ids: dict[str, None]) -> str:
+    """Return the item's ID, keeping its legacy ID if it was seen under that one.
+
+    Items recorded before the switch to BLAKE2b keep their old ID, so they
+    aren't announced again and their feed GUIDs stay stable.
+    """
+    item_id = generate_item_id(product_id, title, link)
+    if item_id not in seen_ids:
+        legacy_id = legacy_item_id(product_id, title, link)
+        if legacy_id in seen_ids:
+            return legacy_id
+    return item_id
+
+
+def remember_item_id(seen_ids: dict[str, None], item_id: str):
+    """Record an item ID as seen, forgetting the oldest beyond MAX_SEEN_IDS.
+
+    seen_ids is used as an insertion-ordered set: O(1) lookups like a set,
+    oldest-first eviction like a bounded queue.
+    """
+    seen_ids[item_id] = None
+    if len(seen_ids) > MAX_SEEN_IDS:
+        del seen_ids[next(iter(seen_ids))]
+
+
 def truncate_text(text: str, max_length: int = 300) -> str:
     """Truncate text to max_length, breaking at word boundary."""
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     if len(text) <= max_length:
         return text
     truncated = text[:max_length].rsplit(" ", 1)[0]
@@ -342,23 +681,24 @@ def clean_text(text: str) -> str:
     """Clean up scraped text."""
     if not text:
         return ""
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)
-    return text
+    return _CTRL_RE.sub('', _WS_RE.sub(' ', text).strip())
 
 
 # --- Source Handlers ---
 
-def check_rss_source(product: dict) -> list[dict]:
+async def check_rss_source(session: aiohttp.ClientSession, product: dict) -> list[dict]:
     """Check an RSS/Atom feed for new items."""
     feed_url = product["source"]["feed_url"]
-    print(f"  Checking RSS feed: {feed_url}")
+    log(f"  Checking RSS feed: {feed_url}")
 
-    resp = make_request(feed_url)
-    if not resp:
-        return []
+    return await fetch_and_parse(session, feed_url, product, _parse_rss_feed)
 
-    feed = feedparser.parse(resp.content)
+
+def _parse_rss_feed(content: bytes, product: dict) -> list[dict]:
+    """Extract the latest entries from an RSS/Atom feed."""
+    # Summaries are reduced to plain text below, so feedparser's own sanitizing
+    # and URI resolution would only be discarded
+    feed = feedparser.parse(content, sanitize_html=False, resolve_relative_uris=False)
     items = []
     for entry in feed.entries[:10]:  # Only check latest 10 entries
         title = clean_text(getattr(entry, "title", "Untitled"))
@@ -367,9 +707,13 @@ def check_rss_source(product: dict) -> list[dict]:
         if not summary and hasattr(entry, "description"):
             summary = clean_text(entry.description)
 
-        # Strip HTML from summary
-        if summary and ("<" in summary):
-            soup = BeautifulSoup(summary, "html.parser")
+        # Strip HTML from summary. A "<" that isn't part of a tag can skip the
+        # parse, unless there are entities that the parse would have decoded.
+        if summary and ("<" in summary) and ("&" in summary or _TAG_RE.search(summary)):
+            soup = BeautifulSoup(summary, HTML_PARSER)
+            # Unsanitized, so drop script/style/applet bodies rather than keep them as text
+            for tag in soup.find_all(_UNSAFE_SUMMARY_TAGS):
+                tag.decompose()
             summary = clean_text(soup.get_text())
         summary = truncate_text(summary)
 
@@ -390,28 +734,41 @@ def check_rss_source(product: dict) -> list[dict]:
     return items
 
 
-def check_scrape_source(product: dict) -> list[dict]:
+async def check_scrape_source(session: aiohttp.ClientSession, product: dict) -> list[dict]:
     """Scrape a web page for release notes."""
-    from urllib.parse import urljoin
+    url = product["source"]["url"]
+    log(f"  Scraping page: {url}")
+
+    return await fetch_and_parse(session, url, product, _parse_scrape_page)
+
+
+def absolute_link(href: str, page_url: str) -> str:
+    """Resolve an absolute or root-relative href against the page URL.
+
+    Other relative hrefs resolve to "", as scraped links have never followed them.
+    """
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("/"):
+        return urljoin(page_url, href)
+    return ""
 
+
+def _parse_scrape_page(content: bytes, product: dict) -> list[dict]:
+    """Extract release note items from a scraped page's HTML."""
     source = product["source"]
     url = source["url"]
-    print(f"  Scraping page: {url}")
-
-    resp = make_request(url)
-    if not resp:
-        return []
 
     # Check if page is mostly empty (JS-rendered)
-    soup = BeautifulSoup(resp.content, "html.parser")
+    soup = BeautifulSoup(content, HTML_PARSER)
 
     # Remove script, style, nav, footer, header elements to focus on content
-    for tag in soup.select("script, style, nav, footer, header, noscript, svg, iframe"):
+    for tag in soup.find_all(_JUNK_TAGS):
         tag.decompose()
 
     body_text = clean_text(soup.get_text()) if soup.body else ""
     if len(body_text) < 100:
-        print(f"  [WARN] Page appears JS-rendered or empty ({len(body_text)} chars). Scraping may fail.")
+        log(f"  [WARN] Page appears JS-rendered or empty ({len(body_text)} chars). Scraping may fail.")
 
     items = []
 
@@ -419,71 +776,75 @@ def check_scrape_source(product: dict) -> list[dict]:
     selector = source.get("selector", "article")
     elements = soup.select(selector)
     if elements:
-        print(f"  Found {len(elements)} elements with selector: {selector}")
+        log(f"  Found {len(elements)} elements with selector: {selector}")
 
-    # Strategy 2: Common changelog patterns
+    # Strategy 2: Common changelog patterns. Walk the tree once for all of them,
+    # then keep the candidates matching the highest-priority pattern.
     if not elements:
-        for fallback_selector in ["article", ".changelog-entry", ".release-note", ".post",
-                                  "section:not(:empty)", ".entry", ".update",
-                                  "[class*='release']", "[class*='changelog']", "[class*='update']"]:
-            elements = soup.select(fallback_selector)
+        candidates = _FALLBACK_CSS.select(soup)
+        for fallback_selector, fallback_css in _FALLBACK_PATTERNS:
+            elements = [el for el in candidates if fallback_css.match(el)]
             if elements:
-                print(f"  Fallback selector matched: {fallback_selector} ({len(elements)} elements)")
+                log(f"  Fallback selector matched: {fallback_selector} ({len(elements)} elements)")
                 break
 
     # Strategy 3: Headings as entry markers
     if not elements:
-        elements = soup.select("h2, h3")
+        elements = _HEADINGS_CSS.select(soup)
         if elements:
-            print(f"  Using headings as entries ({len(elements)} found)")
+            log(f"  Using headings as entries ({len(elements)} found)")
 
     # Strategy 4: Links that look like changelog entries
     if not elements:
-        all_links = soup.select("a[href]")
-        version_pattern = re.compile(r'(v?\d+\.\d+|release|update|version|changelog|what.?s.new)', re.I)
-        elements = [a for a in all_links if version_pattern.search(a.get_text() + " " + a.get("href", ""))]
+        all_links = _LINK_CSS.select(soup)
+        elements = [a for a in all_links if _VERSION_LINK_RE.search(a.get_text() + " " + a.get("href", ""))]
         if elements:
-            print(f"  Found {len(elements)} version-like links")
+            log(f"  Found {len(elements)} version-like links")
 
     if not elements:
-        print(f"  [WARN] No elements found on page. Site may require JavaScript.")
+        log(f"  [WARN] No elements found on page. Site may require JavaScript.")
         return []
 
+    # Compile the per-element selectors once rather than on every lookup
+    title_sel = source.get("title_selector", "h2, h3")
+    date_sel = source.get("date_selector")
+    summary_sel = source.get("summary_selector", "p")
+    title_css = soupsieve.compile(title_sel) if title_sel else None
+    date_css = soupsieve.compile(date_sel) if date_sel else None
+    summary_css = soupsieve.compile(summary_sel) if summary_sel else None
+
     for el in elements[:10]:
+        el_text = None  # The element's full text, extracted at most once
+
         # Extract title
-        title_sel = source.get("title_selector", "h2, h3")
-        title_el = el.select_one(title_sel) if title_sel else None
+        title_el = title_css.select_one(el) if title_css else None
         if title_el:
             title = clean_text(title_el.get_text())
-        elif el.name in ("a", "h2", "h3", "h4", "td", "strong"):
-            title = clean_text(el.get_text()[:150])
         else:
-            title = clean_text(el.get_text()[:150])
+            el_text = el.get_text()
+            title = clean_text(el_text[:150])
 
         if not title or len(title) < 3:
             continue
 
         # Extract date
-        date_sel = source.get("date_selector")
         date_text = None
-        if date_sel:
-            date_el = el.select_one(date_sel)
+        if date_css:
+            date_el = date_css.select_one(el)
             if date_el:
                 date_text = clean_text(date_el.get_text())
         # Also check for time/datetime attributes
         if not date_text:
-            time_el = el.select_one("time[datetime]")
+            time_el = _TIME_CSS.select_one(el)
             if time_el:
                 date_text = time_el.get("datetime", "")
 
         # Extract summary
-        summary_sel = source.get("summary_selector", "p")
         summary = ""
-        if summary_sel:
-            summary_els = el.select(summary_sel)
+        if summary_css:
+            summary_els = summary_css.select(el, limit=3)
             if summary_els:
-                summary_parts = [clean_text(s.get_text()) for s in summary_els[:3]]
-                summary = " ".join(summary_parts)
+                summary = " ".join(clean_text(s.get_text()) for s in summary_els)
         if not summary:
             # Get next sibling text if element is a heading
             if el.name in ("h2", "h3", "h4", "strong"):
@@ -491,34 +852,20 @@ def check_scrape_source(product: dict) -> list[dict]:
                 if sibling and sibling.name in ("p", "ul", "div"):
                     summary = clean_text(sibling.get_text()[:500])
         if not summary:
-            summary = clean_text(el.get_text()[:500])
+            if el_text is None:
+                el_text = el.get_text()
+            summary = clean_text(el_text[:500])
         # Don't use the title as the summary
         if summary == title:
             summary = ""
         summary = truncate_text(summary)
 
         # Extract link
-        link = product["release_notes_url"]
-        if el.name == "a" and el.get("href"):
-            href = el.get("href", "")
-            if href.startswith(("http://", "https://")):
-                link = href
-            elif href.startswith("/"):
-                link = urljoin(url, href)
-        else:
-            link_el = el.select_one("a[href]")
-            if link_el:
-                href = link_el.get("href", "")
-                if href.startswith(("http://", "https://")):
-                    link = href
-                elif href.startswith("/"):
-                    link = urljoin(url, href)
+        link_el = el if el.name == "a" and el.get("href") else _LINK_CSS.select_one(el)
+        link = (link_el and absolute_link(link_el.get("href", ""), url)) or product["release_notes_url"]
 
         # Skip generic/navigation items
-        skip_words = {"menu", "navigation", "sidebar", "footer", "header", "cookie",
-                      "privacy", "sign in", "log in", "subscribe", "contact", "about us"}
-        title_lower = title.lower()
-        if any(w in title_lower for w in skip_words):
+        if _SKIP_WORDS_RE.search(title):
             continue
 
         # Skip very long titles (likely scraped whole paragraphs)
@@ -532,13 +879,20 @@ def check_scrape_source(product: dict) -> list[dict]:
             "date": date_text or "",
         })
 
-    print(f"  Scraped {len(items)} items from page")
+    log(f"  Scraped {len(items)} items from page")
     return items
 
 
-def check_nextjs_blog_source(product: dict) -> list[dict]:
+async def check_nextjs_blog_source(session: aiohttp.ClientSession, product: dict) -> list[dict]:
     """Extract blog posts from a Next.js site's __NEXT_DATA__ JSON."""
-    from urllib.parse import urljoin
+    url = product["source"]["url"]
+    log(f"  Next.js blog: {url}")
+
+    return await fetch_and_parse(session, url, product, _parse_next_data)
+
+
+def _parse_next_data(content: bytes, product: dict) -> list[dict]:
+    """Extract blog posts from the __NEXT_DATA__ JSON embedded in a page's HTML."""
     import json as _json
 
     source = product["source"]
@@ -548,22 +902,18 @@ def check_nextjs_blog_source(product: dict) -> list[dict]:
     date_key = source.get("date_key", "publishDate")
     slug_key = source.get("slug_key", "slug")
     slug_prefix = source.get("slug_prefix", "")
-    print(f"  Next.js blog: {url}")
 
-    resp = make_request(url)
-    if not resp:
-        return []
-
-    soup = BeautifulSoup(resp.content, "html.parser")
+    # Only the __NEXT_DATA__ script is needed, so skip building the rest of the DOM
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=SoupStrainer("script", id="__NEXT_DATA__"))
     script_tag = soup.find("script", id="__NEXT_DATA__")
     if not script_tag or not script_tag.string:
-        print("  [WARN] No __NEXT_DATA__ found. Site may not be Next.js.")
+        log("  [WARN] No __NEXT_DATA__ found. Site may not be Next.js.")
         return []
 
     try:
         next_data = _json.loads(script_tag.string)
     except Exception as e:
-        print(f"  [WARN] Failed to parse __NEXT_DATA__: {e}")
+        log(f"  [WARN] Failed to parse __NEXT_DATA__: {e}")
         return []
 
     # Navigate the JSON path to find posts
@@ -572,14 +922,14 @@ def check_nextjs_blog_source(product: dict) -> list[dict]:
         if isinstance(obj, dict):
             obj = obj.get(key, {})
         else:
-            print(f"  [WARN] Could not traverse path: {posts_path}")
+            log(f"  [WARN] Could not traverse path: {posts_path}")
             return []
 
     if not isinstance(obj, list):
-        print(f"  [WARN] Path {posts_path} did not resolve to a list")
+        log(f"  [WARN] Path {posts_path} did not resolve to a list")
         return []
 
-    print(f"  Found {len(obj)} posts in __NEXT_DATA__")
+    log(f"  Found {len(obj)} posts in __NEXT_DATA__")
     items = []
     for post in obj[:10]:
         title = post.get(title_key, "").strip()
@@ -595,17 +945,25 @@ def check_nextjs_blog_source(product: dict) -> list[dict]:
             "date": date_val or "",
         })
 
-    print(f"  Extracted {len(items)} items")
+    log(f"  Extracted {len(items)} items")
     return items
 
 
+@lru_cache(maxsize=None)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern | None:
+    """Compile keywords into one alternation regex, or None if there are none."""
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
 def apply_keyword_filters(items: list[dict], product: dict) -> list[dict]:
     """Filter items based on include/exclude keyword rules."""
     filters = product.get("filter", {})
-    include_keywords = [k.lower() for k in filters.get("include", [])]
-    exclude_keywords = [k.lower() for k in filters.get("exclude", [])]
+    include_re = _keyword_pattern(tuple(k.lower() for k in filters.get("include", [])))
+    exclude_re = _keyword_pattern(tuple(k.lower() for k in filters.get("exclude", [])))
 
-    if not include_keywords and not exclude_keywords:
+    if include_re is None and exclude_re is None:
         return items
 
     filtered = []
@@ -615,21 +973,19 @@ def apply_keyword_filters(items: list[dict], product: dict) -> list[dict]:
         text = title_lower + " " + summary_lower
 
         # Include filter: item must match at least one keyword
-        if include_keywords:
-            if not any(kw in text for kw in include_keywords):
-                print(f"    SKIP (no include match): {item['title'][:60]}")
-                continue
+        if include_re is not None and not include_re.search(text):
+            log(f"    SKIP (no include match): {item['title'][:60]}")
+            continue
 
         # Exclude filter: item must not match any keyword
-        if exclude_keywords:
-            if any(kw in text for kw in exclude_keywords):
-                print(f"    SKIP (exclude match): {item['title'][:60]}")
-                continue
+        if exclude_re is not None and exclude_re.search(text):
+            log(f"    SKIP (exclude match): {item['title'][:60]}")
+            continue
 
         filtered.append(item)
 
     if len(filtered) != len(items):
-        print(f"  Keyword filter: {len(items)} -> {len(filtered)} items")
+        log(f"  Keyword filter: {len(items)} -> {len(filtered)} items")
     return filtered
 
 
@@ -657,7 +1013,7 @@ def check_intercom_article_source(product: dict) -> list[dict]:
     month_selector = source.get("month_selector", "h2")
     date_selector = source.get("date_selector", "h3")
 
-    print(f"  Intercom article: {url}")
+    log(f"  Intercom article: {url}")
 
     # Try multiple strategies to fetch the page (sites like OpenAI tighten bot protection)
     resp_content = None
@@ -668,9 +1024,9 @@ def check_intercom_article_source(product: dict) -> list[dict]:
         resp = cffi_requests.get(url, timeout=REQUEST_TIMEOUT, impersonate="chrome")
         resp.raise_for_status()
         resp_content = resp.content
-        print(f"  Fetched via curl_cffi")
+        log(f"  Fetched via curl_cffi")
     except Exception as e:
-        print(f"  [INFO] curl_cffi failed ({e}), trying cloudscraper...")
+        log(f"  [INFO] curl_cffi failed ({e}), trying cloudscraper...")
 
     # Strategy 2: cloudscraper (Cloudflare JS challenge solver)
     if resp_content is None:
@@ -679,9 +1035,9 @@ def check_intercom_article_source(product: dict) -> list[dict]:
             resp = scraper.get(url, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
             resp_content = resp.content
-            print(f"  Fetched via cloudscraper")
+            log(f"  Fetched via cloudscraper")
         except Exception as e:
-            print(f"  [WARN] Failed to fetch {url}: {e}")
+            log(f"  [WARN] Failed to fetch {url}: {e}")
             return []
 
     soup = BeautifulSoup(resp_content, "html.parser")
@@ -697,32 +1053,19 @@ def check_intercom_article_source(product: dict) -> list[dict]:
 
     if not article_body:
         article_body = soup.body or soup
-        for tag in article_body.select("script, style, nav, footer, header, noscript, svg, iframe"):
+        for tag in article_body.find_all(_JUNK_TAGS):
             tag.decompose()
 
     body_text = clean_text(article_body.get_text()) if article_body else ""
     if len(body_text) < 100:
-        print(f"  [WARN] Article body appears empty ({len(body_text)} chars). Page may require JavaScript.")
+        log(f"  [WARN] Article body appears empty ({len(body_text)} chars). Page may require JavaScript.")
         return []
 
-    print(f"  Article body: {len(body_text)} chars")
+    log(f"  Article body: {len(body_text)} chars")
 
     items = []
     current_date = None
 
-    # Date patterns to detect date headings (e.g., "March 2, 2026")
-    date_pattern = re.compile(
-        r'(?:January|February|March|April|May|June|July|August|September|October|November|December)'
-        r'\s+\d{1,2},?\s+\d{4}',
-        re.IGNORECASE
-    )
-    # Month pattern to detect month-only headings (e.g., "March 2026")
-    month_pattern = re.compile(
-        r'^(?:January|February|March|April|May|June|July|August|September|October|November|December)'
-        r'\s+\d{4}$',
-        re.IGNORECASE
-    )
-
     for el in article_body.find_all(True):
         # Skip elements nested inside list items - these are reference links
         if el.find_parent(["li", "ul", "ol"]):
@@ -735,20 +1078,19 @@ def check_intercom_article_source(product: dict) -> list[dict]:
             continue
 
         # Detect month headings (h2) - skip these as entries
-        if tag_name == month_selector and month_pattern.match(text):
+        if tag_name == month_selector and _MONTH_HEADING_RE.match(text):
             continue
 
         # Detect date headings (h3) - set the current_date context
-        if tag_name == date_selector and date_pattern.search(text):
-            date_match = date_pattern.search(text)
-            if date_match:
-                try:
-                    date_str = date_match.group(0).replace(",", "")
-                    current_date = datetime.strptime(date_str, "%B %d %Y").replace(
-                        tzinfo=timezone.utc
-                    ).isoformat()
-                except ValueError:
-                    current_date = ""
+        date_match = _DATE_HEADING_RE.search(text) if tag_name == date_selector else None
+        if date_match:
+            try:
+                date_str = date_match.group(0).replace(",", "")
+                current_date = datetime.strptime(date_str, "%B %d %Y").replace(
+                    tzinfo=timezone.utc
+                ).isoformat()
+            except ValueError:
+                current_date = ""
             continue
 
         # Detect entry titles - bold text inside a paragraph (Intercom pattern)
@@ -771,12 +1113,7 @@ def check_intercom_article_source(product: dict) -> list[dict]:
                 continue
 
             # Skip navigation-like items and generic short phrases
-            skip_words = {"menu", "navigation", "sidebar", "footer", "header",
-                          "cookie", "privacy", "sign in", "log in", "subscribe",
-                          "contact", "about us", "our blog post", "learn more",
-                          "read more", "see more", "click here"}
-            title_lower = title.lower()
-            if any(w in title_lower for w in skip_words):
+            if _INTERCOM_SKIP_WORDS_RE.search(title):
                 continue
 
             # Skip very short generic titles
@@ -812,63 +1149,159 @@ def check_intercom_article_source(product: dict) -> list[dict]:
                 "date": current_date or "",
             })
 
-    print(f"  Parsed {len(items)} release entries from Intercom article")
+    log(f"  Parsed {len(items)} release entries from Intercom article")
     return items
 
-def check_product(product: dict) -> list[dict]:
+async def check_product(session: aiohttp.ClientSession, product: dict) -> list[dict]:
     """Check a product for new releases based on its source type."""
     source_type = product["source"]["type"]
 
     if source_type == "rss":
-        items = check_rss_source(product)
+        items = await check_rss_source(session, product)
     elif source_type == "scrape":
-        items = check_scrape_source(product)
+        items = await check_scrape_source(session, product)
     elif source_type == "zendesk_api":
-        items = check_zendesk_api_source(product)
+        items = await check_zendesk_api_source(session, product)
     elif source_type == "nextjs_blog":
-        items = check_nextjs_blog_source(product)
+        items = await check_nextjs_blog_source(session, product)
     elif source_type == "zendesk_article":
-        return check_zendesk_article_source(product)
+        # cloudscraper/curl_cffi are blocking, so run them off the event loop
+        return await asyncio.to_thread(check_zendesk_article_source, product)
     elif source_type == "intercom_article":
-        items = check_intercom_article_source(product)
+        items = await asyncio.to_thread(check_intercom_article_source, product)
     else:
-        print(f"  [WARN] Unknown source type: {source_type}")
+        log(f"  [WARN] Unknown source type: {source_type}")
         return []
 
     return apply_keyword_filters(items, product)
 
 
+async def _check_product_logged(session: aiohttp.ClientSession, product: dict) -> tuple[list[dict] | Exception, list[str]]:
+    """Check a product, capturing its log lines instead of interleaving them."""
+    # Each gathered task runs in its own copy of the context, and to_thread
+    # carries it into worker threads, so the buffer is this product's alone
+    output: list[str] = []
+    _product_log.set(output)
+    try:
+        return await check_product(session, product), output
+    except Exception as e:
+        return e, output
+
+
+async def check_all_products(product_groups: list[list[dict]]) -> list[list[tuple]]:
+    """Check every product concurrently, returning results grouped like the input.
+
+    Each result is a (items, output) pair. items is the product's list of
+    items, or the exception raised while checking it, so one failing product
+    doesn't abort the whole run. output is the product's log lines.
+    """
+    _host_semaphores.clear()  # Semaphores are bound to the event loop that first uses them
+    _host_next_request.clear()
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_PER_HOST)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers={"User-Agent": USER_AGENT}
+    ) as session:
+        return await asyncio.gather(*(
+            asyncio.gather(*(_check_product_logged(session, p) for p in products))
+            for products in product_groups
+        ))
+
+
+def expand_products(products: list[dict]) -> list[dict]:
+    """Expand products with subproducts into individual entries.
+
+    Subproducts inherit the parent's release notes URL and filter unless they
+    set their own, and always use the parent's domain and icon.
+    """
+    return [
+        p if sub is p else {
+            "name": sub["id"],
+            "release_notes_url": p.get("release_notes_url", ""),
+            **({"filter": p["filter"]} if "filter" in p else {}),
+            **sub,
+            "domain": p.get("domain", ""),
+            "icon_url": p.get("icon_url", ""),
+        }
+        for p in products
+        for sub in p.get("subproducts", [p])
+    ]
+
+
 # --- RSS Feed Generation ---
 
-def generate_rss_feed(team: dict, all_items: list[dict], base_url: str) -> str:
+RFC822_FORMAT = "%a, %d %b %Y %H:%M:%S +0000"
+
+# HTML card used as each RSS item's description, filled in with str.format_map
+_DESCRIPTION_TEMPLATE = (
+    '<div style="font-family:-apple-system,BlinkMacSystemFont,Segoe UI,Roboto,sans-serif;'
+    'max-width:600px;padding:12px;border:1px solid #e0e0e0;border-radius:8px;'
+    'background:#ffffff;">'
+    '<div style="display:flex;align-items:center;margin-bottom:8px;">'
+    '<img src="{icon_url}" alt="{product_name}" width="32" height="32" '
+    'style="border-radius:6px;margin-right:10px;"/>'
+    '<strong style="font-size:15px;color:#1a1a1a;">{product_name}</strong>'
+    '</div>'
+    '{summary_html}'
+    '<a href="{link}" style="color:#3b82f6;font-size:13px;'
+    'text-decoration:none;">View release notes \u2192</a>'
+    '</div>'
+)
+_SUMMARY_TEMPLATE = '<p style="margin:0 0 10px;color:#444;font-size:14px;line-height:1.5;">{}</p>'
+
+
+@lru_cache(maxsize=4096)
+def _iso_to_rfc822(value: str) -> str:
+    """Convert an ISO 8601 date string to the RFC 822 form used by RSS."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime(RFC822_FORMAT)
+
+
+# Characters XML 1.0 can't represent; lxml refuses to serialize text containing them
+_XML_ILLEGAL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+
+def xml_text(value: str) -> str:
+    """Drop characters that aren't allowed in XML, so one bad item can't break a feed."""
+    return _XML_ILLEGAL_RE.sub("", value)
+
+
+def serialize_xml(root) -> bytes:
+    """Serialize an element as indented UTF-8 XML with an XML declaration."""
+    if LXML_ETREE:
+        return tostring(root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+    indent(root, space="  ")
+    return tostring(root, xml_declaration=True, encoding="UTF-8") + b"\n"
+
+
+def generate_rss_feed(team: dict, all_items: list[dict], base_url: str) -> bytes:
     """Generate an RSS 2.0 XML feed for a team."""
-    rss = Element("rss", version="2.0")
-    rss.set("xmlns:atom", "http://www.w3.org/2005/Atom")
-    rss.set("xmlns:content", "http://purl.org/rss/1.0/modules/content/")
+    if LXML_ETREE:
+        rss = Element("rss", version="2.0", nsmap={"atom": ATOM_NS, "content": CONTENT_NS})
+    else:
+        # ElementTree declares the atom prefix itself once an atom: tag is used
+        register_namespace("atom", ATOM_NS)
+        rss = Element("rss", {"version": "2.0", "xmlns:content": CONTENT_NS})
 
     channel = SubElement(rss, "channel")
 
     # Channel metadata
-    SubElement(channel, "title").text = f"{team['name']} - Release Notes"
-    SubElement(channel, "description").text = (
+    SubElement(channel, "title").text = xml_text(f"{team['name']} - Release Notes")
+    SubElement(channel, "description").text = xml_text(
         team.get("description", f"Release notes for products managed by {team['name']}")
     )
-    feed_link = f"{base_url}/feeds/{team['id']}.xml"
+    feed_link = xml_text(f"{base_url}/feeds/{team['id']}.xml")
     SubElement(channel, "link").text = feed_link
     SubElement(channel, "language").text = "en-us"
-    SubElement(channel, "lastBuildDate").text = datetime.now(timezone.utc).strftime(
-        "%a, %d %b %Y %H:%M:%S +0000"
-    )
+    SubElement(channel, "lastBuildDate").text = datetime.now(timezone.utc).strftime(RFC822_FORMAT)
 
     # Atom self link
-    atom_link = SubElement(channel, "atom:link")
+    atom_link = SubElement(channel, f"{{{ATOM_NS}}}link")
     atom_link.set("href", feed_link)
     atom_link.set("rel", "self")
     atom_link.set("type", "application/rss+xml")
 
-    # Sort items by date (newest first), limit to MAX_FEED_ITEMS
-    sorted_items = sorted(all_items, key=lambda x: x.get("date", ""), reverse=True)
-    sorted_items = sorted_items[:MAX_FEED_ITEMS]
+    # Newest MAX_FEED_ITEMS items by date, without sorting the whole list
+    sorted_items = heapq.nlargest(MAX_FEED_ITEMS, all_items, key=lambda x: x.get("date", ""))
 
     for item_data in sorted_items:
         item = SubElement(channel, "item")
@@ -877,88 +1310,52 @@ def generate_rss_feed(team: dict, all_items: list[dict], base_url: str) -> str:
         title = item_data["title"]
         display_title = f"{product_name} - {title}" if product_name else title
 
-        SubElement(item, "title").text = display_title
-        SubElement(item, "link").text = item_data["link"]
+        SubElement(item, "title").text = xml_text(display_title)
+        SubElement(item, "link").text = xml_text(item_data["link"])
 
         # Rich description with product icon and summary
-        icon_url = item_data.get("icon_url", "")
         summary = item_data.get("summary", "")
-        description_html = (
-            f'<div style="font-family:-apple-system,BlinkMacSystemFont,Segoe UI,Roboto,sans-serif;'
-            f'max-width:600px;padding:12px;border:1px solid #e0e0e0;border-radius:8px;'
-            f'background:#ffffff;">'
-            f'<div style="display:flex;align-items:center;margin-bottom:8px;">'
-            f'<img src="{icon_url}" alt="{product_name}" width="32" height="32" '
-            f'style="border-radius:6px;margin-right:10px;"/>'
-            f'<strong style="font-size:15px;color:#1a1a1a;">{product_name}</strong>'
-            f'</div>'
-            f'{f"<p style=\"margin:0 0 10px;color:#444;font-size:14px;line-height:1.5;\">{summary}</p>" if summary else ""}'
-            f'<a href="{item_data["link"]}" style="color:#3b82f6;font-size:13px;'
-            f'text-decoration:none;">View release notes \u2192</a>'
-            f'</div>'
-        )
-        SubElement(item, "description").text = description_html
+        SubElement(item, "description").text = xml_text(_DESCRIPTION_TEMPLATE.format_map({
+            "icon_url": item_data.get("icon_url", ""),
+            "product_name": product_name,
+            "summary_html": _SUMMARY_TEMPLATE.format(summary) if summary else "",
+            "link": item_data["link"],
+        }))
 
         # GUID
         guid = SubElement(item, "guid")
         guid.set("isPermaLink", "false")
-        guid.text = item_data.get("id", generate_item_id(
+        guid.text = xml_text(item_data.get("id", generate_item_id(
             item_data.get("product_id", ""), title, item_data["link"]
-        ))
+        )))
 
         # Publication date
         if item_data.get("date"):
             try:
-                dt = datetime.fromisoformat(item_data["date"].replace("Z", "+00:00"))
-                SubElement(item, "pubDate").text = dt.strftime(
-                    "%a, %d %b %Y %H:%M:%S +0000"
-                )
-            except (ValueError, AttributeError):
-                SubElement(item, "pubDate").text = datetime.now(timezone.utc).strftime(
-                    "%a, %d %b %Y %H:%M:%S +0000"
-                )
-
-    # Pretty print
-    xml_str = tostring(rss, encoding="unicode", xml_declaration=False)
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
-    try:
-        dom = minidom.parseString(xml_str)
-        return dom.toprettyxml(indent="  ", encoding=None).replace(
-            '<?xml version="1.0" ?>',
-            '<?xml version="1.0" encoding="UTF-8"?>'
-        )
-    except Exception:
-        return xml_str
+                SubElement(item, "pubDate").text = _iso_to_rfc822(item_data["date"])
+            except (ValueError, AttributeError, TypeError):
+                SubElement(item, "pubDate").text = datetime.now(timezone.utc).strftime(RFC822_FORMAT)
+
+    return serialize_xml(rss)
 
 
-def generate_opml(teams: list[dict], base_url: str) -> str:
+def generate_opml(teams: list[dict], base_url: str) -> bytes:
     """Generate an OPML file listing all team feeds for easy subscription."""
     opml = Element("opml", version="2.0")
     head = SubElement(opml, "head")
     SubElement(head, "title").text = "Release Notes Monitor - All Feeds"
-    SubElement(head, "dateCreated").text = datetime.now(timezone.utc).strftime(
-        "%a, %d %b %Y %H:%M:%S +0000"
-    )
+    SubElement(head, "dateCreated").text = datetime.now(timezone.utc).strftime(RFC822_FORMAT)
 
     body = SubElement(opml, "body")
     for team in teams:
         outline = SubElement(body, "outline")
-        outline.set("text", f"{team['name']} Release Notes")
-        outline.set("title", f"{team['name']} Release Notes")
+        outline.set("text", xml_text(f"{team['name']} Release Notes"))
+        outline.set("title", xml_text(f"{team['name']} Release Notes"))
         outline.set("type", "rss")
-        outline.set("xmlUrl", f"{base_url}/feeds/{team['id']}.xml")
-        outline.set("htmlUrl", base_url)
+        outline.set("xmlUrl", xml_text(f"{base_url}/feeds/{team['id']}.xml"))
+        outline.set("htmlUrl", xml_text(base_url))
 
-    xml_str = tostring(opml, encoding="unicode", xml_declaration=False)
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
-    try:
-        dom = minidom.parseString(xml_str)
-        return dom.toprettyxml(indent="  ", encoding=None).replace(
-            '<?xml version="1.0" ?>',
-            '<?xml version="1.0" encoding="UTF-8"?>'
-        )
-    except Exception:
-        return xml_str
+    return serialize_xml(opml)
 
 
 # --- Main ---
@@ -971,7 +1368,11 @@ def main():
 
     # Load config and seen data
     config = load_json(CONFIG_FILE)
-    seen = load_json(SEEN_FILE)
+    seen = {
+        team_id: {product_id: dict.fromkeys(ids[-MAX_SEEN_IDS:]) for product_id, ids in team_seen.items()}
+        for team_id, team_seen in load_json(SEEN_FILE).items()
+    }
+    load_http_cache()
     teams = config.get("teams", [])
 
     if not teams:
@@ -985,14 +1386,19 @@ def main():
     # Ensure feeds directory exists
     FEEDS_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Fetch every product across all teams concurrently
+    team_products = [expand_products(team.get("products", [])) for team in teams]
+    team_results = asyncio.run(check_all_products(team_products))
+
     new_items_total = 0
     all_new_items = []
-    for team in teams:
+    all_team_items = []  # Every team's feed items, for the master feed
+    feed_writes: list[tuple[Path, bytes]] = []  # Written together once all feeds are built
+    for team, products, results in zip(teams, team_products, team_results):
         team_id = team["id"]
         team_name = team["name"]
-        products = team.get("products", [])
 
-        print(f"\n--- Team: {team_name} ({len(products)} products) ---")
+        print(f"\n--- Team: {team_name} ({len(team.get('products', []))} products) ---")
 
         # Initialize seen data for this team
         if team_id not in seen:
@@ -1003,9 +1409,8 @@ def main():
         existing_items = []
         if existing_feed_path.exists():
             try:
-                with open(existing_feed_path, "r", encoding="utf-8") as f:
-                    existing_items = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                existing_items = load_json(existing_feed_path)
+            except (ValueError, IOError):
                 existing_items = []
 
         new_team_items = []
@@ -1017,43 +1422,26 @@ def main():
             if item.get("date"):
                 existing_dates[item["id"]] = item["date"]
 
-        # Expand products with subproducts into individual entries
-        expanded_products = []
-        for p in products:
-            if "subproducts" in p:
-                for sub in p["subproducts"]:
-                    expanded = {
-                        "id": sub["id"],
-                        "name": sub.get("name", sub["id"]),
-                        "domain": p.get("domain", ""),
-                        "icon_url": p.get("icon_url", ""),
-                        "release_notes_url": sub.get("release_notes_url", p.get("release_notes_url", "")),
-                        "source": sub["source"],
-                    }
-                    if "filter" in sub:
-                        expanded["filter"] = sub["filter"]
-                    elif "filter" in p:
-                        expanded["filter"] = p["filter"]
-                    expanded_products.append(expanded)
-            else:
-                expanded_products.append(p)
-        products = expanded_products
-
-        for product in products:
+        for product, (raw_items, output) in zip(products, results):
             product_id = product["id"]
             product_name = product["name"]
             print(f"\n  Checking: {product_name}")
+            if output:
+                print("\n".join(output))
+
+            if isinstance(raw_items, Exception):
+                print(f"  [ERROR] Failed to check {product_name}: {raw_items}")
+                traceback.print_exception(raw_items)
+                continue
 
             try:
-                raw_items = check_product(product)
                 print(f"  Found {len(raw_items)} items from source")
 
-                if product_id not in seen[team_id]:
-                    seen[team_id][product_id] = []
+                seen_ids = seen[team_id].setdefault(product_id, {})
 
                 # Always enrich the latest items for the feed
                 for i, raw_item in enumerate(raw_items[:RECENT_PER_PRODUCT]):
-                    item_id = generate_item_id(product_id, raw_item["title"], raw_item["link"])
+                    item_id = resolve_item_id(product_id, raw_item["title"], raw_item["link"], seen_ids)
 
                     # Prefer: 1) date from scraper, 2) existing date from prior run, 3) now()
                     item_date = (
@@ -1075,8 +1463,8 @@ def main():
                     recent_items.append(enriched_item)
 
                     # Track new vs seen
-                    if item_id not in seen[team_id][product_id]:
-                        seen[team_id][product_id].append(item_id)
+                    if item_id not in seen_ids:
+                        remember_item_id(seen_ids, item_id)
                         new_team_items.append(enriched_item)
                         print(f"    NEW: {raw_item['title'][:80]}")
                     else:
@@ -1084,38 +1472,28 @@ def main():
 
                 # Also track remaining items beyond the top 5 for seen
                 for raw_item in raw_items[RECENT_PER_PRODUCT:]:
-                    item_id = generate_item_id(product_id, raw_item["title"], raw_item["link"])
-                    if item_id not in seen[team_id][product_id]:
-                        seen[team_id][product_id].append(item_id)
-
-                # Keep seen list from growing unbounded
-                seen[team_id][product_id] = seen[team_id][product_id][-200:]
+                    item_id = resolve_item_id(product_id, raw_item["title"], raw_item["link"], seen_ids)
+                    if item_id not in seen_ids:
+                        remember_item_id(seen_ids, item_id)
 
             except Exception as e:
                 print(f"  [ERROR] Failed to check {product_name}: {e}")
                 traceback.print_exc()
 
-            # Be polite to servers
-            time.sleep(1)
-
-        # Combine: recent items (always fresh) + existing history, deduplicate
-        all_items = recent_items + existing_items
-        seen_ids = set()
-        deduped_items = []
-        for item in all_items:
-            if item["id"] not in seen_ids:
-                seen_ids.add(item["id"])
-                deduped_items.append(item)
-        deduped_items = deduped_items[:MAX_FEED_ITEMS]
+        # Combine: recent items (always fresh) + existing history, deduplicate.
+        # setdefault keeps the first copy of each ID, so recent items win.
+        unique_items: dict[str, dict] = {}
+        for item in recent_items + existing_items:
+            unique_items.setdefault(item["id"], item)
+        deduped_items = list(unique_items.values())[:MAX_FEED_ITEMS]
+        all_team_items.extend(deduped_items)
 
         # Save items data (JSON backup for persistence)
-        save_json(existing_feed_path, deduped_items)
+        feed_writes.append((existing_feed_path, dump_json(deduped_items)))
 
         # Generate RSS feed
         rss_xml = generate_rss_feed(team, deduped_items, base_url)
-        rss_path = FEEDS_DIR / f"{team_id}.xml"
-        with open(rss_path, "w", encoding="utf-8") as f:
-            f.write(rss_xml)
+        feed_writes.append((FEEDS_DIR / f"{team_id}.xml", rss_xml))
 
         print(f"\n  Team '{team_name}': {len(new_team_items)} new items, {len(deduped_items)} total in feed")
         new_items_total += len(new_team_items)
@@ -1127,29 +1505,18 @@ def main():
 
     # Generate OPML for easy subscription
     opml_xml = generate_opml(teams, base_url)
-    opml_path = FEEDS_DIR / "all-feeds.opml"
-    with open(opml_path, "w", encoding="utf-8") as f:
-        f.write(opml_xml)
+    feed_writes.append((FEEDS_DIR / "all-feeds.opml", opml_xml))
 
     # Generate a master feed combining all teams
-    all_team_items = []
-    for team in teams:
-        team_feed_path = FEEDS_DIR / f"{team['id']}.json"
-        if team_feed_path.exists():
-            try:
-                with open(team_feed_path, "r", encoding="utf-8") as f:
-                    all_team_items.extend(json.load(f))
-            except (json.JSONDecodeError, IOError):
-                pass
-
     master_team = {
         "id": "all",
         "name": "All Teams",
         "description": "Combined release notes from all teams",
     }
     master_rss = generate_rss_feed(master_team, all_team_items, base_url)
-    with open(FEEDS_DIR / "all.xml", "w", encoding="utf-8") as f:
-        f.write(master_rss)
+    feed_writes.append((FEEDS_DIR / "all.xml", master_rss))
+
+    write_files(feed_writes)
 
     # Send Slack notifications for new items
     send_slack_notifications(all_new_items, base_url)
@@ -1161,8 +1528,13 @@ def main():
     print("\n--- Google Chat ---")
     send_gchat_notifications(all_new_items, base_url)
 
-    # Save seen data
-    save_json(SEEN_FILE, seen)
+    # Save seen data and HTTP validators for the next run's conditional requests
+    save_json(SEEN_FILE, {
+        team_id: {product_id: list(ids) for product_id, ids in team_seen.items()}
+        for team_id, team_seen in seen.items()
+    }, compact=True)
+    prune_http_cache()
+    save_json(HTTP_CACHE_FILE, _http_cache, compact=True)
 
     print(f"\n{'=' * 60}")
     print(f"Done! {new_items_total} new items found across all teams.")
@@ -20,6 +20,9 @@ from datetime import datetime, timezone
 
 import requests
 
+# Shared session so consecutive posts reuse the same keep-alive connection
+_SESSION = requests.Session()
+
 
 # ── Card Building ────────────────────────────────────────────────────────────
 
@@ -142,7 +145,7 @@ def send_gchat_notifications(new_items: list[dict], base_url: str):
 
             payload = {"cardsV2": cards}
 
-            resp = requests.post(
+            resp = _SESSION.post(
                 webhook_url,
                 headers={"Content-Type": "application/json; charset=UTF-8"},
                 json=payload,
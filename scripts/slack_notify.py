@@ -15,6 +15,9 @@ import requests
 
 SLACK_API_URL = "https://slack.com/api/chat.postMessage"
 
+# Shared session so consecutive posts reuse the same keep-alive connection
+_SESSION = requests.Session()
+
 # Accent colour for the card's left-side bar (Davidson red)
 CARD_COLOR = "#c91230"
 
@@ -62,7 +65,7 @@ def send_slack_notifications(new_items: list[dict], base_url: str):
             "text": f"{len(items)} new release note{'s' if len(items) != 1 else ''}",
         }
         try:
-            resp = requests.post(SLACK_API_URL, headers=headers, json=payload, timeout=10)
+            resp = _SESSION.post(SLACK_API_URL, headers=headers, json=payload, timeout=10)
             data = resp.json()
             if data.get("ok"):
                 print(f"  Slack: posted {len(items)} items to {channel}")
@@ -30,6 +30,9 @@ ZOOM_OAUTH_URL = "https://zoom.us/oauth/token"
 ZOOM_CHATBOT_URL = "https://api.zoom.us/v2/im/chat/messages"
 ZOOM_CHAT_URL = "https://api.zoom.us/v2/chat/users/me/messages"
 
+# Shared session so consecutive posts reuse the same keep-alive connection
+_SESSION = requests.Session()
+
 # JID suffix for Zoom Team Chat group channels
 CHANNEL_JID_SUFFIX = "@conference.xmpp.zoom.us"
 
@@ -48,7 +51,7 @@ def _get_access_token() -> str:
         raise RuntimeError("Missing ZOOM_CLIENT_ID, ZOOM_CLIENT_SECRET, or ZOOM_ACCOUNT_ID")
 
     credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
-    resp = requests.post(
+    resp = _SESSION.post(
         ZOOM_OAUTH_URL,
         headers={
             "Authorization": f"Basic {credentials}",
@@ -81,7 +84,7 @@ def _get_chatbot_token() -> str:
         raise RuntimeError("Missing ZOOM_CHATBOT_CLIENT_ID or ZOOM_CHATBOT_CLIENT_SECRET")
 
     credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
-    resp = requests.post(
+    resp = _SESSION.post(
         ZOOM_OAUTH_URL,
         headers={
             "Authorization": f"Basic {credentials}",
@@ -115,7 +118,7 @@ def _get_admin_user_jid(s2s_token: str) -> str:
     try:
         if target_email:
             # Look up the specific user by email
-            resp = requests.get(
+            resp = _SESSION.get(
                 f"https://api.zoom.us/v2/users/{target_email}",
                 headers={"Authorization": f"Bearer {s2s_token}"},
                 timeout=15,
@@ -131,7 +134,7 @@ def _get_admin_user_jid(s2s_token: str) -> str:
             print(f"    Warning: /v2/users/{target_email} returned no user ID")
         else:
             # Fallback: first active user
-            resp = requests.get(
+            resp = _SESSION.get(
                 "https://api.zoom.us/v2/users",
                 headers={"Authorization": f"Bearer {s2s_token}"},
                 params={"page_size": 1, "status": "active"},
@@ -329,7 +332,7 @@ def _send_via_chatbot(channel_id: str, body: list[dict], token: str,
         },
     }
 
-    resp = requests.post(
+    resp = _SESSION.post(
         ZOOM_CHATBOT_URL,
         headers={
             "Authorization": f"Bearer {token}",
@@ -352,7 +355,7 @@ def _send_via_user_chat(channel_id: str, message: str, token: str) -> bool:
         "message": message,
         "to_channel": channel_id,
     }
-    resp = requests.post(
+    resp = _SESSION.post(
         ZOOM_CHAT_URL,
         headers={
             "Authorization": f"Bearer {token}",
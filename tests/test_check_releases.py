@@ -0,0 +1,66 @@
+"""Tests for scripts/check_releases.py. Run with: python -m unittest discover tests"""
+
+import sys
+import unittest
+from pathlib import Path
+from xml.etree import ElementTree
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import check_releases  # noqa: E402
+
+
+class GenerateRssFeedTest(unittest.TestCase):
+    def test_control_characters_are_stripped(self):
+        items = [{
+            "id": "abc123",
+            "product_id": "p",
+            "product_name": "Prod\x01uct",
+            "title": "Bad\u0008title",
+            "link": "https://example.com/\x0cnotes",
+            "summary": "Sum\x00mary ￾ text",
+            "date": "2026-01-02T03:04:05+00:00",
+        }]
+        team = {"id": "t", "name": "Team\x1f"}
+
+        xml = check_releases.generate_rss_feed(team, items, "https://example.com")
+
+        item = ElementTree.fromstring(xml).find("channel/item")
+        self.assertEqual(item.findtext("title"), "Product - Badtitle")
+        self.assertEqual(item.findtext("link"), "https://example.com/notes")
+        self.assertIn("Summary  text", item.findtext("description"))
+
+
+class ParseRssFeedTest(unittest.TestCase):
+    def test_summary_entities_are_decoded_without_tags(self):
+        feed = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel><title>x</title>'
+            b'<item><title>A</title><link>https://example.com/a</link>'
+            b'<description>Fish &amp;amp; chips for under &lt; 5</description></item>'
+            b'</channel></rss>'
+        )
+
+        items = check_releases._parse_rss_feed(feed, {"release_notes_url": "https://example.com"})
+
+        self.assertEqual(items[0]["summary"], "Fish & chips for under < 5")
+
+
+class PruneHttpCacheTest(unittest.TestCase):
+    def tearDown(self):
+        check_releases._http_cache.clear()
+        check_releases._http_cache_used.clear()
+
+    def test_unused_urls_and_fingerprints_are_dropped(self):
+        check_releases._http_cache.update({
+            "https://example.com/kept": {"items": {"current": [], "stale": []}},
+            "https://example.com/removed": {"items": {"current": []}},
+        })
+        check_releases._http_cache_used["https://example.com/kept"] = {"current"}
+
+        check_releases.prune_http_cache()
+
+        self.assertEqual(check_releases._http_cache, {"https://example.com/kept": {"items": {"current": []}}})
+
+
+if __name__ == "__main__":
+    unittest.main()